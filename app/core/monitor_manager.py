@@ -4,13 +4,32 @@ Monitor Manager - managing 3 monitors by frequency
 
 import asyncio
 import logging
-from datetime import datetime
+import time
 from typing import Dict, Optional, Callable, Any
 
 from app.core.websocket import websocket_manager
 
 logger = logging.getLogger(__name__)
 
+# Max time (seconds) to wait for the other monitors due on the same tick
+# before sending the updates collected so far
+COALESCE_TIMEOUT = 0.5
+
+# Last formatted timestamp: (epoch second, ISO string)
+_timestamp_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Returns current local time as ISO string (second resolution)
+    The formatted string is reused within the same second
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now)))
+    return _timestamp_cache[1]
+
 
 class MonitorManager:
     """
@@ -21,6 +40,8 @@ class MonitorManager:
         """Initialize the manager"""
         self.monitors: Dict[str, Dict] = {}  # topic -> {task, interval, data_function}
         self.static_sent: set = set()  # static topics that have already been sent
+        self._start_time: Optional[float] = None  # loop time all periodic ticks are aligned to
+        self._tick_groups: Dict[int, Dict] = {}  # tick time (ms) -> {data, future, flushing}
     
     def register_monitor(
         self,
@@ -53,6 +74,9 @@ class MonitorManager:
         """
         Start all monitors
         """
+        if self._start_time is None:
+            self._start_time = asyncio.get_running_loop().time()
+        
         for topic, monitor_info in self.monitors.items():
             if monitor_info["task"] is not None:
                 continue  # already running
@@ -95,6 +119,98 @@ class MonitorManager:
         
         logger.info("All monitors stopped")
     
+    def _next_tick(self, interval: float, tick: int) -> int:
+        """
+        Returns number of the next tick (after tick) on the shared monitor clock
+        Ticks that were already missed are skipped
+        """
+        elapsed = asyncio.get_running_loop().time() - self._start_time
+        return max(tick + 1, int(elapsed // interval) + 1)
+    
+    def _due_topics(self, tick_time: float) -> set:
+        """
+        Returns periodic topics that are due at tick_time and will send an update
+        """
+        elapsed = tick_time - self._start_time
+        due = set()
+        for topic, monitor_info in self.monitors.items():
+            interval = monitor_info["interval"]
+            task = monitor_info["task"]
+            if interval is None or task is None or task.done():
+                continue
+            ticks = elapsed / interval
+            if abs(ticks - round(ticks)) < 1e-6 and websocket_manager.has_subscribers(topic):
+                due.add(topic)
+        return due
+    
+    async def tick_group(self, topic: str, data: Dict[str, Any], tick_time: Optional[float] = None) -> int:
+        """
+        Broadcast monitor update, coalescing updates that are due on the same tick
+        Monitors share one clock, so when their ticks coincide (e.g. fast and slow
+        every 60s) the last one to collect its data sends all updates in one frame
+        Args:
+            topic: Topic name
+            data: Data to send
+            tick_time: Loop time of the tick this update belongs to (None = send now)
+        Returns:
+            Number of connections that received the update for this topic
+        """
+        due = self._due_topics(tick_time) if tick_time is not None else set()
+        if len(due) <= 1:
+            sent_counts = await websocket_manager.broadcast_batch({topic: data})
+            return sent_counts.get(topic, 0)
+        
+        key = round(tick_time * 1000)
+        group = self._tick_groups.get(key)
+        if group is not None and group["flushing"]:
+            # Arrived after the group was sent - send alone
+            sent_counts = await websocket_manager.broadcast_batch({topic: data})
+            return sent_counts.get(topic, 0)
+        
+        if group is None:
+            # Drop groups of earlier ticks
+            for old_key in [k for k in self._tick_groups if k < key]:
+                del self._tick_groups[old_key]
+            group = {
+                "data": {},
+                "future": asyncio.get_running_loop().create_future(),
+                "flushing": False
+            }
+            self._tick_groups[key] = group
+        
+        group["data"][topic] = data
+        
+        if due <= group["data"].keys():
+            # Last one in - send the whole group
+            await self._flush_tick_group(group)
+        else:
+            try:
+                await asyncio.wait_for(asyncio.shield(group["future"]), COALESCE_TIMEOUT)
+            except asyncio.TimeoutError:
+                # A due monitor is late or failed - don't hold the others back
+                await self._flush_tick_group(group)
+        
+        return group["future"].result().get(topic, 0)
+    
+    async def _flush_tick_group(self, group: Dict) -> None:
+        """
+        Send collected updates of a tick group and resolve its future
+        """
+        future = group["future"]
+        if group["flushing"]:
+            await asyncio.shield(future)
+            return
+        
+        group["flushing"] = True
+        try:
+            sent_counts = await websocket_manager.broadcast_batch(group["data"])
+        except BaseException:
+            # Resolve (never cancel) the shared future, so a cancelled or failed
+            # sender doesn't stop the other monitors waiting on it
+            future.set_result({})
+            raise
+        future.set_result(sent_counts)
+    
     async def _send_one_time(self, topic: str) -> None:
         """
         Send one-time update
@@ -111,20 +227,20 @@ class MonitorManager:
             
             data_function = monitor_info["data_function"]
             
-            # Collect data
+            # Collect data (in a thread, so blocking reads don't stall the event loop)
             logger.debug(f"Collecting data for static topic '{topic}'")
-            data = data_function()
+            data = await asyncio.to_thread(data_function)
             if not isinstance(data, dict):
                 logger.error(f"Data function for '{topic}' did not return a dict, got: {type(data)}")
                 return
             
-            data["timestamp"] = datetime.now().isoformat()
+            data["timestamp"] = _now_iso()
             
             # Short wait so clients have time to subscribe
             await asyncio.sleep(1)
             
             # Send via WebSocket
-            sent_count = await websocket_manager.broadcast(topic, data)
+            sent_count = await self.tick_group(topic, data)
             
             # Update static_sent only after successful send
             if sent_count >= 0:  # Even if there are no subscribers, this is considered success
@@ -144,27 +260,30 @@ class MonitorManager:
         """
         logger.info(f"Starting monitor loop for '{topic}' with interval: {interval}s")
         
+        monitor_info = self.monitors.get(topic)
+        if not monitor_info:
+            logger.error(f"Monitor '{topic}' not found in registered monitors")
+            return
+        
+        # Bind hot lookups once, outside the loop
+        data_function = monitor_info["data_function"]
+        broadcast = self.tick_group
+        has_subscribers = websocket_manager.has_subscribers
+        
         # Send immediately at start (before the first sleep)
         try:
-            monitor_info = self.monitors.get(topic)
-            if not monitor_info:
-                logger.error(f"Monitor '{topic}' not found in registered monitors")
-                return
-            
-            data_function = monitor_info["data_function"]
-            
             logger.debug(f"Collecting initial data for topic '{topic}'")
-            data = data_function()
+            data = await asyncio.to_thread(data_function)
             if not isinstance(data, dict):
                 logger.error(f"Data function for '{topic}' did not return a dict, got: {type(data)}")
                 return
             
-            data["timestamp"] = datetime.now().isoformat()
+            data["timestamp"] = _now_iso()
             
             # Short wait so clients have time to subscribe
             await asyncio.sleep(1)
             
-            sent_count = await websocket_manager.broadcast(topic, data)
+            sent_count = await broadcast(topic, data)
             
             if sent_count > 0:
                 logger.debug(f"Broadcasted '{topic}' to {sent_count} connections (initial)")
@@ -180,35 +299,37 @@ class MonitorManager:
         # Now the regular loop
         consecutive_errors = 0
         max_consecutive_errors = 5
+        loop = asyncio.get_running_loop()
+        tick = 0
         
         while True:
             try:
-                monitor_info = self.monitors.get(topic)
-                if not monitor_info:
-                    logger.error(f"Monitor '{topic}' not found in registered monitors, stopping loop")
-                    break
+                # Wait for the next tick on the shared clock, so monitors
+                # whose intervals coincide wake up together
+                tick = self._next_tick(interval, tick)
+                tick_time = self._start_time + tick * interval
+                await asyncio.sleep(tick_time - loop.time())
                 
-                data_function = monitor_info["data_function"]
+                # Skip collecting data when nobody is listening
+                if not has_subscribers(topic):
+                    logger.debug(f"No subscribers for topic '{topic}', skipping")
+                    continue
                 
-                # Collect data
+                # Collect data (in a thread, so blocking reads don't stall the event loop)
                 logger.debug(f"Collecting data for topic '{topic}'")
-                data = data_function()
+                data = await asyncio.to_thread(data_function)
                 if not isinstance(data, dict):
                     logger.error(f"Data function for '{topic}' did not return a dict, got: {type(data)}")
                     consecutive_errors += 1
                     if consecutive_errors >= max_consecutive_errors:
                         logger.error(f"Too many consecutive errors for '{topic}', stopping loop")
                         break
-                    await asyncio.sleep(interval)
                     continue
                 
-                data["timestamp"] = datetime.now().isoformat()
-                
-                # Wait before next update
-                await asyncio.sleep(interval)
+                data["timestamp"] = _now_iso()
                 
                 # Send via WebSocket
-                sent_count = await websocket_manager.broadcast(topic, data)
+                sent_count = await broadcast(topic, data, tick_time)
                 
                 # Reset error counter after successful send
                 if consecutive_errors > 0:
@@ -229,15 +350,12 @@ class MonitorManager:
                 if consecutive_errors >= max_consecutive_errors:
                     logger.error(f"Too many consecutive errors for '{topic}', stopping loop")
                     break
-                await asyncio.sleep(interval)
             except Exception as e:
                 logger.error(f"Error in monitor loop for '{topic}': {e}", exc_info=True)
                 consecutive_errors += 1
                 if consecutive_errors >= max_consecutive_errors:
                     logger.error(f"Too many consecutive errors ({consecutive_errors}) for '{topic}', stopping loop")
                     break
-                # In case of error, wait before next attempt
-                await asyncio.sleep(interval)
 
 
 # Create global instance
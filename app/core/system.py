@@ -3,16 +3,81 @@ Shared services for system data collection
 Reusable across different modules
 """
 
+import bisect
 import platform
 import os
+import threading
+import time
 import psutil
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, TextIO, Tuple
+
+# Number of CPU cores doesn't change after boot
+CPU_COUNT = os.cpu_count() or 1
+
+# Cached static values (computed on first call)
+_OS_INFO_CACHE: Optional[str] = None
+_CPU_INFO_CACHE: Optional[str] = None
+_RAM_TOTAL_CACHE: Optional[str] = None
+
+# Temperature thresholds (°C) and matching CSS classes
+_TEMP_BUCKETS = (40, 55, 70)
+_TEMP_CLASSES = ("cold", "normal", "warm", "hot")
+
+# Last formatted uptime: (uptime in whole minutes, formatted string)
+_uptime_cache: Tuple[int, str] = (-1, "")
+
+# CPU usage sampling - get_cpu_usage() is the only caller of psutil.cpu_percent,
+# so psutil's baseline is private to it
+_CPU_SAMPLE_MAX_AGE = 15.0  # seconds; an older baseline is re-sampled instead of averaged
+_CPU_SAMPLE_INTERVAL = 0.1  # seconds; length of a fresh (blocking) sample
+_cpu_sampled_at: Optional[float] = None
+_cpu_usage_last = 0.0
+
+# Held-open /proc and /sys files (path -> file), re-read with seek(0)
+_PROC_FILES: Dict[str, TextIO] = {}
+_PROC_FILES_LOCK = threading.Lock()  # monitors may sample from worker threads
+
+
+def _read_proc_file(path: str) -> str:
+    """
+    Reads the whole content of a /proc or /sys file
+    The file is kept open between calls and rewound instead of reopened
+    Raises OSError if the file cannot be opened
+    """
+    with _PROC_FILES_LOCK:
+        f = _PROC_FILES.get(path)
+        if f is not None:
+            try:
+                f.seek(0)
+                return f.read()
+            except (OSError, ValueError):
+                # Stale handle - drop it and reopen below
+                _PROC_FILES.pop(path, None)
+                try:
+                    f.close()
+                except OSError:
+                    pass
+        
+        f = open(path, 'r')
+        _PROC_FILES[path] = f
+        return f.read()
 
 
 def get_os_info() -> str:
     """
     Returns operating system information
     Example: "Debian GNU/Linux 13 (bookworm)"
+    Cached after the first call
+    """
+    global _OS_INFO_CACHE
+    if _OS_INFO_CACHE is None:
+        _OS_INFO_CACHE = _read_os_info()
+    return _OS_INFO_CACHE
+
+
+def _read_os_info() -> str:
+    """
+    Reads operating system information from /etc/os-release
     """
     try:
         with open('/etc/os-release', 'r') as f:
@@ -33,6 +98,17 @@ def get_cpu_info() -> str:
     """
     Returns CPU information
     Example: "Sony UK BCM2837 (4 cores)"
+    Cached after the first call
+    """
+    global _CPU_INFO_CACHE
+    if _CPU_INFO_CACHE is None:
+        _CPU_INFO_CACHE = _read_cpu_info()
+    return _CPU_INFO_CACHE
+
+
+def _read_cpu_info() -> str:
+    """
+    Reads CPU information from /proc/cpuinfo
     """
     try:
         with open('/proc/cpuinfo', 'r') as f:
@@ -47,11 +123,10 @@ def get_cpu_info() -> str:
             
             # Example: "Sony UK BCM2837"
             model = cpu_info.get('Model', cpu_info.get('Hardware', platform.processor()))
-            cpu_count = os.cpu_count() or 1
             
-            return f"{model} ({cpu_count} cores)"
+            return f"{model} ({CPU_COUNT} cores)"
     except Exception:
-        return f"{platform.processor()} ({os.cpu_count() or 1} cores)"
+        return f"{platform.processor()} ({CPU_COUNT} cores)"
 
 
 def get_uptime() -> str:
@@ -59,14 +134,21 @@ def get_uptime() -> str:
     Returns system uptime
     Example: "0 days 9 hours 12 minutes"
     """
+    global _uptime_cache
     try:
-        with open('/proc/uptime', 'r') as f:
-            uptime_seconds = float(f.read().split()[0])
-            days = int(uptime_seconds // 86400)
-            hours = int((uptime_seconds % 86400) // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
-            
-            return f"{days} days {hours} hours {minutes} minutes"
+        uptime_seconds = float(_read_proc_file('/proc/uptime').split()[0])
+        
+        # Output has minute resolution - reuse the string within the same minute
+        total_minutes = int(uptime_seconds // 60)
+        if _uptime_cache[0] == total_minutes:
+            return _uptime_cache[1]
+        
+        days, minutes = divmod(total_minutes, 1440)
+        hours, minutes = divmod(minutes, 60)
+        uptime = f"{days} days {hours} hours {minutes} minutes"
+        
+        _uptime_cache = (total_minutes, uptime)
+        return uptime
     except Exception:
         return "N/A"
 
@@ -77,9 +159,8 @@ def get_cpu_temperature() -> Optional[float]:
     None if cannot be read
     """
     try:
-        with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-            temp = int(f.read().strip()) / 1000.0
-            return round(temp, 1)
+        temp = int(_read_proc_file('/sys/class/thermal/thermal_zone0/temp').strip()) / 1000.0
+        return round(temp, 1)
     except Exception:
         return None
 
@@ -95,53 +176,95 @@ def get_temperature_class(temperature: Optional[float]) -> str:
     if temperature is None:
         return "normal"
     
-    if temperature < 40:
-        return "cold"
-    elif temperature < 55:
-        return "normal"
-    elif temperature < 70:
-        return "warm"
-    else:
-        return "hot"
+    return _TEMP_CLASSES[bisect.bisect_right(_TEMP_BUCKETS, temperature)]
 
 
 def get_cpu_usage() -> float:
     """
-    Returns CPU usage percentage
+    Samples CPU usage percentage
+    Average since the previous call; if there was no recent call (first call,
+    or nobody was subscribed), takes a short blocking sample instead
+    Call off the event loop - use get_last_cpu_usage() elsewhere
     """
+    global _cpu_sampled_at, _cpu_usage_last
     try:
-        return round(psutil.cpu_percent(interval=1), 1)
+        if _cpu_sampled_at is None or time.monotonic() - _cpu_sampled_at > _CPU_SAMPLE_MAX_AGE:
+            usage = psutil.cpu_percent(interval=_CPU_SAMPLE_INTERVAL)
+        else:
+            usage = psutil.cpu_percent(interval=None)
+        _cpu_sampled_at = time.monotonic()
+        _cpu_usage_last = round(usage, 1)
+        return _cpu_usage_last
     except Exception:
         return 0.0
 
 
+def get_last_cpu_usage() -> float:
+    """
+    Returns the last CPU usage percentage sampled by get_cpu_usage()
+    Doesn't touch the sampling baseline
+    """
+    return _cpu_usage_last
+
+
+def _read_meminfo() -> Tuple[int, int]:
+    """
+    Returns (total, available) memory in bytes
+    Reads only MemTotal/MemAvailable from /proc/meminfo,
+    falls back to psutil where /proc/meminfo is not available
+    """
+    try:
+        values = {}
+        for line in _read_proc_file('/proc/meminfo').splitlines()[:5]:
+            key, value = line.split(':', 1)
+            values[key] = int(value.split()[0]) * 1024  # kB -> bytes
+        return values['MemTotal'], values['MemAvailable']
+    except (OSError, ValueError, KeyError):
+        ram = psutil.virtual_memory()
+        return ram.total, ram.available
+
+
 def get_ram_usage() -> Tuple[str, str, float]:
     """
     Returns RAM data: (used, total, percent)
     Example: ("1.2GB", "4.0GB", 30.0)
     """
     try:
-        ram = psutil.virtual_memory()
-        ram_total_gb = round(ram.total / (1024**3), 2)
-        ram_used_gb = round(ram.used / (1024**3), 2)
-        ram_percent = round(ram.percent, 1)
+        total, available = _read_meminfo()
+        used = total - available
+        ram_total_gb = round(total / (1024**3), 2)
+        ram_used_gb = round(used / (1024**3), 2)
+        ram_percent = round(used / total * 100, 1) if total else 0.0
         
         return (f"{ram_used_gb}GB", f"{ram_total_gb}GB", ram_percent)
     except Exception:
         return ("0GB", "0GB", 0.0)
 
 
+def get_ram_total() -> str:
+    """
+    Returns total RAM
+    Example: "4.0GB"
+    Cached after the first successful read
+    """
+    global _RAM_TOTAL_CACHE
+    if _RAM_TOTAL_CACHE is None:
+        _, ram_total, _ = get_ram_usage()
+        if ram_total == "0GB":
+            return ram_total  # read failed - don't cache
+        _RAM_TOTAL_CACHE = ram_total
+    return _RAM_TOTAL_CACHE
+
+
 def get_static_info() -> Dict:
     """
     Static data that doesn't change
     For use in one-time updates
     """
-    ram_used, ram_total, _ = get_ram_usage()
-    
     return {
         "os_name": get_os_info(),
         "hardware": get_cpu_info(),
-        "ram_total": ram_total,
+        "ram_total": get_ram_total(),
     }
 
 
@@ -297,7 +420,7 @@ def get_system_info() -> Dict:
         "cpu_temp": cpu_temp or 0.0,
         "cpu_temp_percent": cpu_temp_percent,
         "temp_class": temp_class,
-        "cpu_usage": get_cpu_usage(),
+        "cpu_usage": get_last_cpu_usage(),
         "ram_used": ram_used,
         "ram_total": ram_total,
         "ram_percent": ram_percent,
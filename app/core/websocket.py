@@ -3,13 +3,17 @@ WebSocket Manager for managing connections and topics
 Enables centralized management of all WebSocket connections in the application
 """
 
-from typing import Set, Dict, Optional
+from typing import Set, Dict, List, Optional, Sequence, Tuple
 from fastapi import WebSocket
-import json
+import asyncio
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Max number of concurrent sends per batch before yielding to the event loop
+BROADCAST_BATCH_SIZE = 50
+
 
 class WebSocketManager:
     """
@@ -61,6 +65,22 @@ class WebSocketManager:
         
         logger.info(f"WebSocket disconnected. Total connections: {len(self.connections)}")
     
+    def _disconnect_many(self, websockets: Set[WebSocket]) -> None:
+        """
+        Disconnect several clients at once
+        Args:
+            websockets: WebSocket connections to disconnect
+        """
+        self.connections -= websockets
+        
+        # Remove connections from all topics, dropping topics left empty
+        for topic, subscribers in list(self.topics.items()):
+            subscribers -= websockets
+            if not subscribers:
+                del self.topics[topic]
+        
+        logger.info(f"{len(websockets)} WebSockets disconnected. Total connections: {len(self.connections)}")
+    
     async def subscribe(self, websocket: WebSocket, topic: str) -> bool:
         """
         Subscribe to topic
@@ -111,6 +131,32 @@ class WebSocketManager:
             logger.error(f"Error sending personal message: {e}")
             return False
     
+    async def _send_batched(self, targets: Sequence[WebSocket], payload: str) -> list:
+        """
+        Send payload to connections concurrently, in batches
+        Yields to the event loop between batches so large broadcasts don't stall it
+        Args:
+            targets: WebSocket connections to send to
+            payload: Serialized message
+        Returns:
+            List of results (None or Exception) in the same order as targets
+        """
+        if len(targets) <= BROADCAST_BATCH_SIZE:
+            return await asyncio.gather(
+                *(websocket.send_text(payload) for websocket in targets),
+                return_exceptions=True
+            )
+        
+        results = []
+        for i in range(0, len(targets), BROADCAST_BATCH_SIZE):
+            batch = targets[i:i + BROADCAST_BATCH_SIZE]
+            results.extend(await asyncio.gather(
+                *(websocket.send_text(payload) for websocket in batch),
+                return_exceptions=True
+            ))
+            await asyncio.sleep(0)
+        return results
+    
     async def broadcast(self, topic: str, data: dict) -> int:
         """
         Send update to all subscribers of topic
@@ -120,7 +166,7 @@ class WebSocketManager:
         Returns:
             Number of connections that received the message
         """
-        if topic not in self.topics:
+        if not self.topics.get(topic):
             logger.debug(f"No subscribers for topic: {topic}")
             return 0
         
@@ -128,25 +174,84 @@ class WebSocketManager:
             "topic": topic,
             "data": data
         }
+        # Serialize once and share the same payload between all subscribers
+        payload = orjson.dumps(message).decode()
+        
+        targets = tuple(self.topics[topic])
+        results = await self._send_batched(targets, payload)
         
         disconnected = set()
-        sent_count = 0
-        
-        for websocket in self.topics[topic].copy():
-            try:
-                await websocket.send_json(message)
-                sent_count += 1
-            except Exception as e:
-                logger.warning(f"Error broadcasting to WebSocket: {e}")
+        for websocket, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error broadcasting to WebSocket: {result}")
                 disconnected.add(websocket)
+        sent_count = sum(1 for result in results if not isinstance(result, Exception))
         
         # Clean up disconnected connections
-        for ws in disconnected:
-            self.disconnect(ws)
+        if disconnected:
+            self._disconnect_many(disconnected)
         
         logger.debug(f"Broadcasted to {sent_count} connections for topic: {topic}")
         return sent_count
     
+    async def broadcast_batch(self, messages: Dict[str, dict]) -> Dict[str, int]:
+        """
+        Send updates for several topics, one frame per connection
+        Connections subscribed to more than one of the topics get a single
+        {"topic": "batch", "data": {topic: data, ...}} message
+        Args:
+            messages: Topic name -> data to send
+        Returns:
+            Topic name -> number of connections that received its update
+        """
+        if len(messages) == 1:
+            topic, data = next(iter(messages.items()))
+            return {topic: await self.broadcast(topic, data)}
+        
+        # Group connections by the topics they are subscribed to
+        subscriptions: Dict[WebSocket, List[str]] = {}
+        for topic in messages:
+            for websocket in self.topics.get(topic, ()):
+                subscriptions.setdefault(websocket, []).append(topic)
+        
+        groups: Dict[Tuple[str, ...], List[WebSocket]] = {}
+        for websocket, topics in subscriptions.items():
+            groups.setdefault(tuple(topics), []).append(websocket)
+        
+        disconnected = set()
+        sent_counts = {topic: 0 for topic in messages}
+        
+        for topics, targets in groups.items():
+            if len(topics) == 1:
+                message = {
+                    "topic": topics[0],
+                    "data": messages[topics[0]]
+                }
+            else:
+                message = {
+                    "topic": "batch",
+                    "data": {topic: messages[topic] for topic in topics}
+                }
+            # Serialize once per group of connections
+            payload = orjson.dumps(message).decode()
+            
+            results = await self._send_batched(targets, payload)
+            
+            for websocket, result in zip(targets, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error broadcasting batch to WebSocket: {result}")
+                    disconnected.add(websocket)
+                else:
+                    for topic in topics:
+                        sent_counts[topic] += 1
+        
+        # Clean up disconnected connections
+        if disconnected:
+            self._disconnect_many(disconnected)
+        
+        logger.debug(f"Broadcasted batch for topics: {sent_counts}")
+        return sent_counts
+    
     async def broadcast_to_all(self, data: dict) -> int:
         """
         Send message to all connections
@@ -159,21 +264,22 @@ class WebSocketManager:
             "topic": "broadcast",
             "data": data
         }
+        # Serialize once and share the same payload between all connections
+        payload = orjson.dumps(message).decode()
+        
+        targets = tuple(self.connections)
+        results = await self._send_batched(targets, payload)
         
         disconnected = set()
-        sent_count = 0
-        
-        for websocket in self.connections.copy():
-            try:
-                await websocket.send_json(message)
-                sent_count += 1
-            except Exception as e:
-                logger.warning(f"Error broadcasting to all: {e}")
+        for websocket, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error broadcasting to all: {result}")
                 disconnected.add(websocket)
+        sent_count = sum(1 for result in results if not isinstance(result, Exception))
         
         # Clean up disconnected connections
-        for ws in disconnected:
-            self.disconnect(ws)
+        if disconnected:
+            self._disconnect_many(disconnected)
         
         logger.debug(f"Broadcasted to {sent_count} connections")
         return sent_count
@@ -186,6 +292,16 @@ class WebSocketManager:
         """
         return len(self.connections)
     
+    def has_subscribers(self, topic: str) -> bool:
+        """
+        Checks whether topic has any subscribers
+        Args:
+            topic: Topic name
+        Returns:
+            True if at least one connection is subscribed
+        """
+        return bool(self.topics.get(topic))
+    
     def get_topic_subscribers_count(self, topic: str) -> int:
         """
         Returns number of subscribers to topic
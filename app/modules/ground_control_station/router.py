@@ -38,8 +38,7 @@ async def gcs_page(request: Request):
 @router.post("/destinations")
 async def save_destinations(request: DestinationsRequest):
     """Save destinations"""
-    destinations_data = [dest.dict() for dest in request.destinations]
-    success = services.save_destinations(destinations_data)
+    success = services.save_destinations(request.destinations)
     
     if success:
         return JSONResponse({"status": "success"})
@@ -1,8 +1,8 @@
 """
 Logic and demo data for Ground Control Station module
 """
-import json
 import os
+import orjson
 from datetime import datetime
 from pathlib import Path
 
@@ -11,6 +11,27 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
 DATA_DIR = BASE_DIR / "data"
 DESTINATIONS_FILE = DATA_DIR / "ground_control_station.json"
 
+# Cached destinations: ((inode, mtime_ns, size) of DESTINATIONS_FILE, destinations)
+_destinations_cache = (None, [])
+
+_LOGS = [
+    {"time": "10:15:32", "level": "INFO", "message": "System initialized"},
+    {"time": "10:15:35", "level": "INFO", "message": "Flight controller connected"},
+    {"time": "10:15:40", "level": "WARNING", "message": "GPS signal weak"},
+    {"time": "10:15:45", "level": "INFO", "message": "GPS signal restored"},
+    {"time": "10:16:00", "level": "INFO", "message": "Ready for takeoff"},
+]
+
+_COMMANDS = [
+    "ARM",
+    "DISARM",
+    "TAKEOFF",
+    "LAND",
+    "RTL",
+    "GUIDED",
+    "AUTO"
+]
+
 
 def ensure_data_dir():
     """Creates the data directory if it doesn't exist"""
@@ -18,57 +39,71 @@ def ensure_data_dir():
 
 
 def load_destinations():
-    """Loads destinations from JSON file"""
+    """
+    Loads destinations from JSON file
+    The parsed file is cached and only re-read when the file changes;
+    callers get copies of the cached destinations
+    """
+    global _destinations_cache
     ensure_data_dir()
     
-    if not DESTINATIONS_FILE.exists():
+    try:
+        stat = DESTINATIONS_FILE.stat()
+    except IOError:
+        # File doesn't exist (yet)
         return []
     
+    file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    if _destinations_cache[0] == file_key:
+        return [dict(dest) for dest in _destinations_cache[1]]
+    
     try:
-        with open(DESTINATIONS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('destinations', [])
-    except (json.JSONDecodeError, IOError):
+        with open(DESTINATIONS_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+            destinations = data.get('destinations', [])
+    except (orjson.JSONDecodeError, IOError):
         return []
+    
+    _destinations_cache = (file_key, destinations)
+    return [dict(dest) for dest in destinations]
 
 
 def save_destinations(destinations):
-    """Saves destinations to JSON file"""
+    """
+    Saves destinations (list of Destination models) to JSON file
+    Writes to a temp file and atomically replaces the original,
+    so a crash mid-write never leaves a corrupted file
+    """
+    global _destinations_cache
     ensure_data_dir()
     
     data = {
-        "destinations": destinations
+        "destinations": [dest.model_dump() for dest in destinations]
     }
     
+    tmp_file = DESTINATIONS_FILE.with_suffix('.json.tmp')
     try:
-        with open(DESTINATIONS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, DESTINATIONS_FILE)
+        # Force the next load to re-read the file
+        _destinations_cache = (None, [])
         return True
-    except IOError:
+    except (IOError, TypeError):
+        # TypeError covers orjson.JSONEncodeError
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
         return False
 
 
 def get_gcs_data():
     """Returns demo data for Ground Control Station"""
-    destinations = load_destinations()
-    
     return {
-        "destinations": destinations,
-        "logs": [
-            {"time": "10:15:32", "level": "INFO", "message": "System initialized"},
-            {"time": "10:15:35", "level": "INFO", "message": "Flight controller connected"},
-            {"time": "10:15:40", "level": "WARNING", "message": "GPS signal weak"},
-            {"time": "10:15:45", "level": "INFO", "message": "GPS signal restored"},
-            {"time": "10:16:00", "level": "INFO", "message": "Ready for takeoff"},
-        ],
-        "commands": [
-            "ARM",
-            "DISARM",
-            "TAKEOFF",
-            "LAND",
-            "RTL",
-            "GUIDED",
-            "AUTO"
-        ]
+        "destinations": load_destinations(),
+        "logs": _LOGS,
+        "commands": _COMMANDS
     }
-
@@ -174,6 +174,14 @@ class WebSocketClient {
      * טיפול בהודעות
      */
     handleMessage(message) {
+        // פירוק הודעת batch להודעות נפרדות לפי topic
+        if (message.topic === "batch" && message.data) {
+            Object.keys(message.data).forEach(topic => {
+                this.handleMessage({ topic: topic, data: message.data[topic] });
+            });
+            return;
+        }
+
         // קריאה לכל ה-handlers
         this.messageHandlers.forEach(handler => {
             try {